@@ -6,7 +6,7 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
 from datetime import datetime
-import asyncio
+import time
 from loguru import logger
 
 from src.config.base_config import settings
@@ -208,7 +208,7 @@ def rate_limit(max_calls: int = 10, window_seconds: int = 60):
                 return await func(*args, **kwargs)
             
             client_ip = request.client.host
-            current_time = asyncio.get_event_loop().time()
+            current_time = time.monotonic()
             
             # Clean old entries
             if client_ip in call_times:
@@ -17,4 +17,7 @@ def setup_logging() -> None:
         rotation="500 MB",
         retention="10 days",
         level=settings.log_level,
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
     )
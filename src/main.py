@@ -8,6 +8,7 @@ from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from loguru import logger
+from openai import AsyncOpenAI
 
 from src.logging_config import setup_logging
 
@@ -38,6 +39,9 @@ async def lifespan(app: FastAPI):
         "openai": True,  # Assume OpenAI is required
     }
 
+    # Shared OpenAI client so status probes reuse one connection pool
+    app.state.openai_client = AsyncOpenAI(api_key=settings.openai_api_key)
+
     # Initialize services with graceful degradation
 
     # Skip Pinecone initialization - removed for minimization
@@ -92,6 +96,8 @@ async def lifespan(app: FastAPI):
 
     # Redis not used in minimized version
 
+    await app.state.openai_client.close()
+
     logger.info("🛑 CX Futurist AI system shut down successfully")
 
 
@@ -125,18 +131,12 @@ async def get_service_status():
         hasattr(app.state, "orchestrator") and app.state.orchestrator is not None
     )
 
-    # Test OpenAI connectivity
+    # Test OpenAI connectivity (model metadata lookup, no billable completion)
     openai_test = {"status": "untested"}
     try:
-        from openai import AsyncOpenAI
-
-        client = AsyncOpenAI(api_key=settings.openai_api_key)
-        response = await client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": "test"}],
-            max_tokens=5,
-        )
-        openai_test = {"status": "connected", "model": "gpt-3.5-turbo"}
+        client = app.state.openai_client
+        model = await client.models.retrieve("gpt-3.5-turbo")
+        openai_test = {"status": "connected", "model": model.id}
     except Exception as e:
         openai_test = {"status": "error", "error": str(e)[:100]}
 
@@ -17,6 +17,21 @@ from src.agents.simple_synthesis_agent import SimpleSynthesisAgent
 from src.websocket.socket_server import agent_stream_callback, broadcast_knowledge_update, broadcast_trend_update, broadcast_scenario_update
 
 
+async def _gather_or_cancel(*aws):
+    """Run awaitables concurrently, cancelling the rest as soon as one fails.
+    
+    Unlike a bare asyncio.gather, sibling agent calls are not left running
+    (and spending tokens) after the workflow has already failed.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
 class WorkflowStatus(Enum):
     """Status of a workflow execution."""
     PENDING = "pending"
@@ -172,7 +187,7 @@ class SimpleOrchestrator:
                 await self.agents[agent_name].collaborate_with("trend_scanner", "Receiving weak signals", weak_signals)
             
             # Execute parallel analyses
-            ai_analysis, customer_analysis, tech_analysis, org_analysis = await asyncio.gather(*analysis_tasks)
+            ai_analysis, customer_analysis, tech_analysis, org_analysis = await _gather_or_cancel(*analysis_tasks)
             
             result.agent_outputs.update({
                 "ai_futurist": ai_analysis,
@@ -269,7 +284,7 @@ class SimpleOrchestrator:
                 self.org_transformation.design_future_organization(domain, timeframe)
             ]
             
-            ai_drivers, tech_trajectories, behavior_shifts, org_evolution = await asyncio.gather(*driver_tasks)
+            ai_drivers, tech_trajectories, behavior_shifts, org_evolution = await _gather_or_cancel(*driver_tasks)
             
             result.agent_outputs.update({
                 "ai_drivers": ai_drivers,
@@ -447,7 +462,7 @@ class SimpleOrchestrator:
             for domain in domains:
                 pattern_tasks.append(self.trend_scanner.scan_for_signals([domain], timeframe="last_quarter"))
             
-            domain_patterns = await asyncio.gather(*pattern_tasks)
+            domain_patterns = await _gather_or_cancel(*pattern_tasks)
             
             patterns_by_domain = {
                 domains[i]: patterns for i, patterns in enumerate(domain_patterns)
@@ -470,7 +485,7 @@ class SimpleOrchestrator:
                 self.org_transformation.identify_cross_industry_transformations(domains, analysis_context)
             ]
             
-            ai_trends, behavior_patterns, tech_convergence, industry_transforms = await asyncio.gather(*perspective_tasks)
+            ai_trends, behavior_patterns, tech_convergence, industry_transforms = await _gather_or_cancel(*perspective_tasks)
             
             result.agent_outputs.update({
                 "ai_trends": ai_trends,
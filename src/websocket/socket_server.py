@@ -140,23 +140,24 @@ async def request_analysis(sid, data):
     return {"status": "accepted", "request_id": data.get("id")}
 
 
+# Map agent event types to socket events
+EVENT_MAPPING = {
+    "token": "agent:thinking",
+    "thought": "agent:thought",
+    "state_update": "agent:status",
+    "collaboration": "agent:collaboration",
+    "insight": "insight:generated",
+    "error": "agent:error"
+}
+
+
 # Agent streaming callback
 async def agent_stream_callback(data: Dict[str, Any]):
     """Callback for agents to stream their updates."""
     event_type = data.get("type")
     agent_name = data.get("agent")
     
-    # Map event types to socket events
-    event_mapping = {
-        "token": "agent:thinking",
-        "thought": "agent:thought",
-        "state_update": "agent:status",
-        "collaboration": "agent:collaboration",
-        "insight": "insight:generated",
-        "error": "agent:error"
-    }
-    
-    socket_event = event_mapping.get(event_type, "agent:update")
+    socket_event = EVENT_MAPPING.get(event_type, "agent:update")
     
     # Broadcast to all interested clients
     await connection_manager.broadcast_agent_update({
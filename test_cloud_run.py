@@ -75,4 +75,9 @@ async def test_cloud_run():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(test_cloud_run())
\ No newline at end of file
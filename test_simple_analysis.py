@@ -1,15 +1,139 @@
 #!/usr/bin/env python3
-"""Test script for the simple analysis endpoint."""
+"""Test script for the simple analysis endpoint.
+
+Pass topics on the command line to also run a batch throughput test, e.g.
+``python test_simple_analysis.py "AI in retail" standard:"Voice commerce"``.
+Topics without a ``depth:`` prefix run as quick analyses.
+"""
 
 import asyncio
 import aiohttp
 import json
 from datetime import datetime
 import sys
+import time
+from typing import Any, Dict, List
+
+BASE_URL = "http://localhost:8080"
+DEPTHS = ("quick", "standard", "comprehensive")
+
+# /api/status body, fetched once per run
+_status_cache: Dict[str, Any] = {}
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create the keep-alive session shared by all tests."""
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=32,
+        keepalive_timeout=90,
+        enable_cleanup_closed=True
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=300)
+    )
+
+
+async def prewarm(session: aiohttp.ClientSession):
+    """Open the keep-alive connection before any measured request."""
+    try:
+        async with session.get(f"{BASE_URL}/health") as response:
+            await response.read()
+    except aiohttp.ClientError:
+        # Connection problems are reported by the tests themselves
+        pass
+
 
-async def test_simple_analysis():
+async def _fetch_json(session: aiohttp.ClientSession, request_id: str):
+    """Fetch the full JSON result for an analysis."""
+    async with session.get(f"{BASE_URL}/api/simple-analysis/simple/{request_id}") as response:
+        payload = await response.json() if response.status == 200 else None
+        return {"status": response.status, "payload": payload}
+
+
+async def _fetch_html(session: aiohttp.ClientSession, request_id: str):
+    """Fetch the HTML report for an analysis and count its size."""
+    async with session.get(f"{BASE_URL}/api/simple-analysis/simple/{request_id}/html") as response:
+        size = 0
+        if response.status == 200:
+            # Only the size is reported, so don't hold the whole page in memory
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                size += len(chunk)
+        return {"status": response.status, "payload": size}
+
+
+async def _list_recent(session: aiohttp.ClientSession):
+    """List recent analyses."""
+    async with session.get(f"{BASE_URL}/api/simple-analysis/simple") as response:
+        payload = await response.json() if response.status == 200 else None
+        return {"status": response.status, "payload": payload}
+
+
+def _print_json_result(json_res):
+    """Print the JSON result probe."""
+    print("\n2️⃣ Getting JSON results...")
+    if isinstance(json_res, Exception):
+        print(f"❌ Error getting JSON results: {json_res}")
+        return
+    if json_res["status"] != 200:
+        print(f"❌ Failed to get JSON results: {json_res['status']}")
+        return
+    
+    full_result = json_res["payload"]
+    print(f"✅ Retrieved full results")
+    
+    # Display summary
+    if full_result.get("results", {}).get("summary"):
+        print(f"\n📝 Executive Summary:")
+        print(f"   {full_result['results']['summary'][:200]}...")
+    
+    # Display insights
+    insights = full_result.get("results", {}).get("key_insights", [])
+    if insights:
+        print(f"\n💡 Key Insights ({len(insights)} total):")
+        for i, insight in enumerate(insights[:3], 1):
+            print(f"   {i}. {insight}")
+        if len(insights) > 3:
+            print(f"   ... and {len(insights) - 3} more")
+    
+    # Display agents that participated
+    agent_outputs = full_result.get("agent_outputs", {})
+    if agent_outputs:
+        print(f"\n🤖 Agents Participated:")
+        for agent in agent_outputs.keys():
+            print(f"   - {agent.replace('_', ' ').title()}")
+
+
+def _print_html_result(html_res, request_id: str):
+    """Print the HTML endpoint probe."""
+    print("\n3️⃣ Testing HTML endpoint...")
+    if isinstance(html_res, Exception):
+        print(f"❌ Error testing HTML endpoint: {html_res}")
+    elif html_res["status"] == 200:
+        print(f"✅ HTML endpoint working ({html_res['payload']} bytes)")
+        print(f"   URL: {BASE_URL}/api/simple-analysis/simple/{request_id}/html")
+    else:
+        print(f"❌ HTML endpoint failed: {html_res['status']}")
+
+
+def _print_recent(list_res):
+    """Print the recent analyses probe."""
+    print("\n4️⃣ Listing recent analyses...")
+    if isinstance(list_res, Exception):
+        print(f"❌ Error listing analyses: {list_res}")
+    elif list_res["status"] == 200:
+        analyses = list_res["payload"]
+        print(f"✅ Found {len(analyses)} recent analyses")
+        for analysis in analyses[:3]:
+            print(f"   - {analysis['request_id']}: {analysis['topic']} ({analysis['status']})")
+    else:
+        print(f"❌ Failed to list analyses: {list_res['status']}")
+
+
+async def test_simple_analysis(session: aiohttp.ClientSession):
     """Test the simple analysis endpoint."""
-    base_url = "http://localhost:8080"
+    base_url = BASE_URL
     
     # Test topic
     test_topic = "AI agent autonomy in customer service"
@@ -19,129 +143,172 @@ async def test_simple_analysis():
     print(f"🎯 Topic: {test_topic}")
     print("=" * 60)
     
-    async with aiohttp.ClientSession() as session:
-        # 1. Start analysis
-        print("\n1️⃣ Starting analysis...")
-        try:
-            async with session.post(
-                f"{base_url}/api/simple-analysis/simple",
-                json={
-                    "topic": test_topic,
-                    "depth": "comprehensive"
-                }
-            ) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    request_id = result.get("request_id")
-                    print(f"✅ Analysis started successfully!")
-                    print(f"   Request ID: {request_id}")
-                    print(f"   Status: {result.get('status')}")
-                    print(f"   Duration: {result.get('duration_seconds', 0):.2f} seconds")
-                    
-                    # 2. Get JSON results
-                    print("\n2️⃣ Getting JSON results...")
-                    async with session.get(f"{base_url}/api/simple-analysis/simple/{request_id}") as json_response:
-                        if json_response.status == 200:
-                            full_result = await json_response.json()
-                            print(f"✅ Retrieved full results")
-                            
-                            # Display summary
-                            if full_result.get("results", {}).get("summary"):
-                                print(f"\n📝 Executive Summary:")
-                                print(f"   {full_result['results']['summary'][:200]}...")
-                            
-                            # Display insights
-                            insights = full_result.get("results", {}).get("key_insights", [])
-                            if insights:
-                                print(f"\n💡 Key Insights ({len(insights)} total):")
-                                for i, insight in enumerate(insights[:3], 1):
-                                    print(f"   {i}. {insight}")
-                                if len(insights) > 3:
-                                    print(f"   ... and {len(insights) - 3} more")
-                            
-                            # Display agents that participated
-                            agent_outputs = full_result.get("agent_outputs", {})
-                            if agent_outputs:
-                                print(f"\n🤖 Agents Participated:")
-                                for agent in agent_outputs.keys():
-                                    print(f"   - {agent.replace('_', ' ').title()}")
-                        else:
-                            print(f"❌ Failed to get JSON results: {json_response.status}")
-                    
-                    # 3. Test HTML endpoint
-                    print("\n3️⃣ Testing HTML endpoint...")
-                    async with session.get(f"{base_url}/api/simple-analysis/simple/{request_id}/html") as html_response:
-                        if html_response.status == 200:
-                            html_content = await html_response.text()
-                            print(f"✅ HTML endpoint working ({len(html_content)} bytes)")
-                            print(f"   URL: {base_url}/api/simple-analysis/simple/{request_id}/html")
-                        else:
-                            print(f"❌ HTML endpoint failed: {html_response.status}")
-                    
-                else:
-                    error_text = await response.text()
-                    print(f"❌ Analysis failed: {response.status}")
-                    print(f"   Error: {error_text}")
-                    
-        except aiohttp.ClientError as e:
-            print(f"❌ Connection error: {e}")
-            print(f"   Make sure the server is running on {base_url}")
-            return False
-        except Exception as e:
-            print(f"❌ Unexpected error: {e}")
-            return False
-    
-    # 4. List recent analyses
-    print("\n4️⃣ Listing recent analyses...")
+    # 1. Start analysis
+    print("\n1️⃣ Starting analysis...")
+    request_id = None
     try:
-        async with session.get(f"{base_url}/api/simple-analysis/simple") as response:
+        async with session.post(
+            f"{base_url}/api/simple-analysis/simple",
+            json={
+                "topic": test_topic,
+                "depth": "comprehensive"
+            }
+        ) as response:
             if response.status == 200:
-                analyses = await response.json()
-                print(f"✅ Found {len(analyses)} recent analyses")
-                for analysis in analyses[:3]:
-                    print(f"   - {analysis['request_id']}: {analysis['topic']} ({analysis['status']})")
+                result = await response.json()
+                request_id = result.get("request_id")
+                print(f"✅ Analysis started successfully!")
+                print(f"   Request ID: {request_id}")
+                print(f"   Status: {result.get('status')}")
+                print(f"   Duration: {result.get('duration_seconds', 0):.2f} seconds")
             else:
-                print(f"❌ Failed to list analyses: {response.status}")
+                error_text = await response.text()
+                print(f"❌ Analysis failed: {response.status}")
+                print(f"   Error: {error_text}")
+                
+    except aiohttp.ClientError as e:
+        print(f"❌ Connection error: {e}")
+        print(f"   Make sure the server is running on {base_url}")
+        return False
     except Exception as e:
-        print(f"❌ Error listing analyses: {e}")
+        print(f"❌ Unexpected error: {e}")
+        return False
+    
+    # 2-4. The read-only probes are independent, so issue them together
+    if request_id:
+        json_res, html_res, list_res = await asyncio.gather(
+            _fetch_json(session, request_id),
+            _fetch_html(session, request_id),
+            _list_recent(session),
+            return_exceptions=True
+        )
+        _print_json_result(json_res)
+        _print_html_result(html_res, request_id)
+    else:
+        try:
+            list_res = await _list_recent(session)
+        except Exception as e:
+            list_res = e
+    _print_recent(list_res)
     
     print("\n" + "=" * 60)
     print("✅ Simple analysis endpoint test completed successfully!")
     return True
 
 
-async def test_status_endpoint():
+async def get_status(session: aiohttp.ClientSession) -> Dict[str, Any]:
+    """Fetch /api/status once per run and reuse the parsed body."""
+    if "body" not in _status_cache:
+        async with session.get(f"{BASE_URL}/api/status") as response:
+            response.raise_for_status()
+            _status_cache["body"] = await response.json()
+    return _status_cache["body"]
+
+
+async def test_status_endpoint(session: aiohttp.ClientSession):
     """Test the service status endpoint."""
-    base_url = "http://localhost:8080"
-    
     print(f"\n🔍 Testing Service Status Endpoint")
     print("=" * 60)
     
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.get(f"{base_url}/api/status") as response:
-                if response.status == 200:
-                    status = await response.json()
-                    print(f"✅ System Status: {status.get('status', 'unknown')}")
-                    print(f"\n🔧 Services:")
-                    for service, available in status.get('services', {}).items():
-                        emoji = "✅" if available else "❌"
-                        print(f"   {emoji} {service.title()}: {'Available' if available else 'Unavailable'}")
-                    
-                    print(f"\n🤖 Orchestrator: {'✅ Ready' if status.get('orchestrator') else '❌ Not Ready'}")
-                    
-                    openai_test = status.get('openai_test', {})
-                    if openai_test.get('status') == 'connected':
-                        print(f"\n🔌 OpenAI Connection: ✅ Connected")
-                        print(f"   Model: {openai_test.get('model')}")
-                    else:
-                        print(f"\n🔌 OpenAI Connection: ❌ Failed")
-                        if openai_test.get('error'):
-                            print(f"   Error: {openai_test['error']}")
-                else:
-                    print(f"❌ Status check failed: {response.status}")
-        except Exception as e:
-            print(f"❌ Error checking status: {e}")
+    try:
+        status = await get_status(session)
+    except aiohttp.ClientResponseError as e:
+        print(f"❌ Status check failed: {e.status}")
+        return
+    except Exception as e:
+        print(f"❌ Error checking status: {e}")
+        return
+    
+    lines = [f"✅ System Status: {status.get('status', 'unknown')}", "\n🔧 Services:"]
+    lines.extend(
+        f"   {'✅' if available else '❌'} {service.title()}: {'Available' if available else 'Unavailable'}"
+        for service, available in status.get('services', {}).items()
+    )
+    lines.append(f"\n🤖 Orchestrator: {'✅ Ready' if status.get('orchestrator') else '❌ Not Ready'}")
+    
+    openai_test = status.get('openai_test', {})
+    if openai_test.get('status') == 'connected':
+        lines.append(f"\n🔌 OpenAI Connection: ✅ Connected")
+        lines.append(f"   Model: {openai_test.get('model')}")
+    else:
+        lines.append(f"\n🔌 OpenAI Connection: ❌ Failed")
+        if openai_test.get('error'):
+            lines.append(f"   Error: {openai_test['error']}")
+    
+    print("\n".join(lines))
+
+
+class BatchProcessor:
+    """Run many simple analyses against the server with bounded concurrency."""
+    
+    def __init__(self, session: aiohttp.ClientSession, max_concurrency: int = 10):
+        self.session = session
+        self.max_concurrency = max_concurrency
+    
+    async def _run_one(self, semaphore: asyncio.Semaphore, topic: str, depth: str):
+        """Run a single analysis once a concurrency slot is free."""
+        async with semaphore:
+            try:
+                async with self.session.post(
+                    f"{BASE_URL}/api/simple-analysis/simple",
+                    json={"topic": topic, "depth": depth}
+                ) as response:
+                    if response.status == 200:
+                        return await response.json()
+                    return {"topic": topic, "status": "failed", "error": f"HTTP {response.status}"}
+            except Exception as e:
+                return {"topic": topic, "status": "failed", "error": str(e)}
+    
+    async def _run_group(self, depth: str, topics: List[str]):
+        """Run all topics of one depth under their own concurrency limit."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return await asyncio.gather(*(self._run_one(semaphore, topic, depth) for topic in topics))
+    
+    async def run(self, topics_by_depth: Dict[str, List[str]]) -> Dict[str, List[Dict[str, Any]]]:
+        """Run every depth group concurrently.
+        
+        Each depth gets its own gather so quick analyses are not queued behind
+        comprehensive ones.
+        """
+        depths = list(topics_by_depth)
+        groups = await asyncio.gather(*(self._run_group(d, topics_by_depth[d]) for d in depths))
+        return dict(zip(depths, groups))
+
+
+def parse_batch_topics(args: List[str]) -> Dict[str, List[str]]:
+    """Group command-line topics by depth; use ``depth:topic`` to pick one."""
+    topics_by_depth: Dict[str, List[str]] = {}
+    for arg in args:
+        depth, sep, topic = arg.partition(":")
+        if not sep or depth not in DEPTHS:
+            depth, topic = "quick", arg
+        topics_by_depth.setdefault(depth, []).append(topic)
+    return topics_by_depth
+
+
+async def test_batch_analysis(session: aiohttp.ClientSession, topics_by_depth: Dict[str, List[str]]):
+    """Test the simple analysis endpoint with many topics at once."""
+    total = sum(len(topics) for topics in topics_by_depth.values())
+    
+    print(f"\n📦 Testing Batch Analysis ({total} topics)")
+    print("=" * 60)
+    
+    start = time.monotonic()
+    results = await BatchProcessor(session).run(topics_by_depth)
+    elapsed = time.monotonic() - start
+    
+    failed = 0
+    for depth, group in results.items():
+        print(f"\n🔎 {depth.title()} ({len(group)} topics):")
+        for result in group:
+            if result.get("status") == "completed":
+                print(f"   ✅ {result.get('topic')} ({result.get('duration_seconds', 0):.2f}s)")
+            else:
+                failed += 1
+                print(f"   ❌ {result.get('topic')}: {result.get('error', result.get('status'))}")
+    
+    print(f"\n⏱️  {total} analyses finished in {elapsed:.2f} seconds")
+    return failed == 0
 
 
 async def main():
@@ -149,11 +316,19 @@ async def main():
     print("\n🚀 CX Futurist AI - Simple Analysis Test Suite")
     print("=" * 60)
     
-    # Test status first
-    await test_status_endpoint()
-    
-    # Then test analysis
-    success = await test_simple_analysis()
+    async with create_session() as session:
+        await prewarm(session)
+        
+        # Test status first
+        await test_status_endpoint(session)
+        
+        # Then test analysis
+        success = await test_simple_analysis(session)
+        
+        # Optionally drive many topics for throughput testing
+        batch_topics = parse_batch_topics(sys.argv[1:])
+        if success and batch_topics:
+            success = await test_batch_analysis(session, batch_topics)
     
     if success:
         print("\n✨ All tests passed! The simple analysis endpoint is working correctly.")
@@ -167,4 +342,9 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file